@@ -0,0 +1,49 @@
+import pytest
+
+from ubc.rates.openei.api import RateSchedule
+
+
+def _by_month(summer, winter):
+    return [summer if 4 <= m <= 9 else winter for m in range(12)]
+
+
+RATE = {
+    "name": "Test TOU",
+    "description": "Two-season TOU rate with demand charges.",
+    "energyratestructure": [[{"rate": r}] for r in [0.11, 0.14, 0.19, 0.10, 0.12]],
+    "energyweekdayschedule": _by_month(
+        [0] * 8 + [1] * 4 + [2] * 6 + [1] * 3 + [0] * 3, [3] * 8 + [4] * 10 + [3] * 6
+    ),
+    "energyweekendschedule": _by_month([0] * 24, [3] * 24),
+    "energyattrs": [
+        {"TOU-summer:Off-Peak": "1"},
+        {"TOU-summer:Part-Peak": "2"},
+        {"TOU-summer:Peak": "3"},
+        {"TOU-winter:Off-Peak": "4"},
+        {"TOU-winter:Part-Peak": "5"},
+    ],
+    "demandratestructure": [[{"rate": r}] for r in [0.0, 5.5, 1.2]],
+    "demandweekdayschedule": _by_month([0] * 12 + [1] * 6 + [0] * 6, [2] * 24),
+    "demandweekendschedule": _by_month([0] * 24, [2] * 24),
+    "demandattrs": [
+        {"TOU-summer:Off-Peak": "1"},
+        {"TOU-summer:Peak": "2"},
+        {"TOU-winter:Off-Peak": "3"},
+    ],
+    "flatdemandstructure": [[{"rate": 10.0}], [{"rate": 12.5}]],
+    "flatdemandmonths": [0] * 4 + [1] * 6 + [0] * 2,
+    "fixedchargefirstmeter": 4.2,
+    "fixedchargeunits": "$/day",
+}
+
+
+class StubRateSchedule(RateSchedule):
+    """Rate schedule served from `RATE` instead of OpenEI."""
+
+    def load_rate(self, refresh=False):
+        return RATE
+
+
+@pytest.fixture
+def schedule():
+    return StubRateSchedule("key", "stub")
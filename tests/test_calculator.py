@@ -0,0 +1,154 @@
+from types import SimpleNamespace
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from ubc.calculator import (
+    SingleSite,
+    _days_per_month,
+    _demand_15min,
+    _hourly_peak_demand,
+    _monthly_max,
+    _monthly_sum,
+)
+
+
+FREQS = ["1 min", "5 min", "7 min", "10 min", "15 min", "30 min", "60 min", "2H"]
+
+STARTS = [
+    # Aligned, crossing a month boundary
+    ("2019-01-31 22:00", None),
+    # Misaligned with the 15 min. and hourly grids
+    ("2019-01-31 22:07", None),
+    # Across the spring forward and fall back DST transitions
+    ("2019-03-09 22:00", "US/Pacific"),
+    ("2019-11-02 22:05", "US/Pacific"),
+    # Inside the repeated fall back hour, on either side of the transition
+    ("2019-11-03 01:05-07:00", "US/Pacific"),
+    ("2019-11-03 01:20-08:00", "US/Pacific"),
+]
+
+
+def make_load(freq, start, tz, periods=3000, descending=False):
+    rng = np.random.default_rng(0)
+    start = pd.Timestamp(start)
+    if tz is not None:
+        start = start.tz_convert(tz) if start.tz else start.tz_localize(tz)
+    index = pd.date_range(start, periods=periods, freq=freq, name="timestamp")
+    values = rng.random(periods) * 100
+    # Leading, scattered and contiguous gaps
+    values[:3] = np.nan
+    values[rng.random(periods) < 0.1] = np.nan
+    values[100:160] = np.nan
+    load = pd.Series(values, index=index, name="kW")
+    return load.iloc[::-1] if descending else load
+
+
+@pytest.fixture(
+    params=[
+        (freq, start, tz, descending)
+        for freq in FREQS
+        for start, tz in STARTS
+        for descending in (False, True)
+    ],
+    ids=lambda p: "{}-{}-{}{}".format(p[0], p[1], p[2], "-desc" if p[3] else ""),
+)
+def load(request):
+    freq, start, tz, descending = request.param
+    return make_load(freq, start, tz, descending=descending)
+
+
+def test_demand_15min(load):
+    expected = load.resample("15 min").mean().ffill()
+    pd.testing.assert_series_equal(_demand_15min(load), expected)
+
+
+def test_hourly_peak_demand(load):
+    expected = load.resample("15 min").mean().ffill().resample("H").max()
+    pd.testing.assert_series_equal(_hourly_peak_demand(_demand_15min(load)), expected)
+
+
+def test_monthly_max(load):
+    pd.testing.assert_series_equal(_monthly_max(load), load.resample("M").max())
+
+    load_15min = _demand_15min(load)
+    pd.testing.assert_series_equal(
+        _monthly_max(load_15min), load_15min.resample("M").max()
+    )
+
+
+def test_monthly_sum(load):
+    expected = load.resample("M").sum()
+    pd.testing.assert_series_equal(
+        _monthly_sum(load.index, load.values), expected, check_names=False
+    )
+
+
+def test_monthly_gaps():
+    load = make_load("15 min", "2019-01-01", None, periods=96 * 120)
+    load = load[load.index.month != 2]
+
+    pd.testing.assert_series_equal(
+        _monthly_max(load), load.resample("M").max(), check_freq=False
+    )
+    pd.testing.assert_series_equal(
+        _monthly_sum(load.index, load.values),
+        load.resample("M").sum(),
+        check_names=False,
+        check_freq=False,
+    )
+
+
+def days(start, end, freq="H", tz=None):
+    return _days_per_month(pd.date_range(start, end, freq=freq, tz=tz))
+
+
+def test_days_per_month_partial_months():
+    result = days("2019-01-15 06:00", "2019-03-10 12:00")
+    expected = pd.Series(
+        [17, 28, 10], index=pd.to_datetime(["2019-01-31", "2019-02-28", "2019-03-31"])
+    )
+    pd.testing.assert_series_equal(result, expected, check_freq=False)
+
+
+def test_days_per_month_single_month():
+    result = days("2020-02-03", "2020-02-05 23:00")
+    expected = pd.Series([3], index=pd.to_datetime(["2020-02-29"]))
+    pd.testing.assert_series_equal(result, expected, check_freq=False)
+
+
+def test_days_per_month_tz_aware_month_end():
+    # 20:00 PST on Jan 31st is already February in UTC.
+    result = days("2019-01-31 20:00", "2019-02-01 03:00", tz="US/Pacific")
+    expected = pd.Series(
+        [1, 1],
+        index=pd.DatetimeIndex(["2019-01-31", "2019-02-28"], tz="US/Pacific"),
+    )
+    pd.testing.assert_series_equal(result, expected, check_freq=False)
+
+
+def test_days_per_month_empty():
+    assert _days_per_month(pd.DatetimeIndex([])).empty
+
+
+@pytest.mark.parametrize(
+    "charge_unit, expected",
+    [("$/day", [31 * 2.0, 28 * 2.0, 31 * 2.0]), ("$/month", [2.0, 2.0, 2.0])],
+)
+def test_meter_charges_bill_days_with_missing_readings(charge_unit, expected):
+    index = pd.date_range("2019-01-01", "2019-03-31 23:00", freq="H")
+    load = pd.Series(1.0, index=index)
+    # Every reading in February and a week of January is missing.
+    load[(index.month == 2) | ((index.month == 1) & (index.day < 8))] = np.nan
+
+    schedule = SimpleNamespace(meter_charge_unit=charge_unit, meter=2.0)
+    result = SingleSite(schedule).calculate_meter_charges(load)
+    np.testing.assert_allclose(result.values, expected)
+    assert list(result.index.month) == [1, 2, 3]
+
+
+def test_meter_charges_empty_load():
+    schedule = SimpleNamespace(meter_charge_unit="$/day", meter=2.0)
+    load = pd.Series([], index=pd.DatetimeIndex([]), dtype=float)
+    assert SingleSite(schedule).calculate_meter_charges(load).empty
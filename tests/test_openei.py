@@ -0,0 +1,105 @@
+import json
+import os
+
+import pytest
+
+from ubc.rates.openei import api
+from ubc.rates.openei.api import RateSchedule, cache_dir
+
+
+RATE = {"label": "abc123", "name": "Test Rate", "description": "A test rate."}
+
+
+class Response:
+    def __init__(self, payload):
+        self.payload = payload
+
+    def json(self):
+        return self.payload
+
+
+@pytest.fixture
+def requests_made(monkeypatch, tmp_path):
+    """Point the cache at a temporary directory and count OpenEI requests."""
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    calls = []
+
+    def get(url, params):
+        calls.append(params["getpage"])
+        rate = dict(RATE, label=params["getpage"], version=len(calls))
+        return Response({"items": [rate]})
+
+    monkeypatch.setattr(api.session, "get", get)
+    api._fetch_rate.cache_clear()
+    yield calls
+    api._fetch_rate.cache_clear()
+
+
+def cached_path(schedule_id):
+    return os.path.join(cache_dir(), f"{schedule_id}.json")
+
+
+def test_cache_dir_follows_environment(monkeypatch, tmp_path):
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    assert cache_dir() == os.path.join(str(tmp_path), "ubc", "openei")
+
+
+def test_download_is_written_to_cache(requests_made):
+    rate = RateSchedule("key", "abc123")
+    assert rate.name == "Test Rate"
+    assert requests_made == ["abc123"]
+    with open(cached_path("abc123")) as f:
+        assert json.load(f)["label"] == "abc123"
+
+
+def test_cache_hit_skips_network(requests_made):
+    os.makedirs(cache_dir())
+    with open(cached_path("abc123"), "w") as f:
+        json.dump(dict(RATE, name="Cached Rate"), f)
+
+    assert RateSchedule("key", "abc123").name == "Cached Rate"
+    assert requests_made == []
+
+
+def test_corrupt_cache_is_refetched(requests_made):
+    os.makedirs(cache_dir())
+    with open(cached_path("abc123"), "w") as f:
+        f.write('{"label": "abc')
+
+    assert RateSchedule("key", "abc123").name == "Test Rate"
+    assert requests_made == ["abc123"]
+    with open(cached_path("abc123")) as f:
+        assert json.load(f)["name"] == "Test Rate"
+
+
+def test_unwritable_cache_does_not_raise(requests_made, monkeypatch, tmp_path):
+    # A file where the cache directory should be cannot be created or written into.
+    blocked = tmp_path / "blocked"
+    blocked.write_text("")
+    monkeypatch.setenv("XDG_CACHE_HOME", str(blocked))
+
+    assert RateSchedule("key", "abc123").name == "Test Rate"
+    assert requests_made == ["abc123"]
+
+
+def test_memory_cache_skips_disk(requests_made):
+    RateSchedule("key", "abc123")
+    os.remove(cached_path("abc123"))
+    RateSchedule("key", "abc123")
+    assert requests_made == ["abc123"]
+
+
+def test_refresh_refetches(requests_made):
+    rate = RateSchedule("key", "abc123")
+    with open(cached_path("abc123"), "w") as f:
+        json.dump(dict(RATE, name="Stale Rate"), f)
+
+    rate.refresh()
+    assert requests_made == ["abc123", "abc123"]
+    assert rate.name == "Test Rate"
+    assert rate.rate["version"] == 2
+    with open(cached_path("abc123")) as f:
+        assert json.load(f)["version"] == 2
+    # Later instances see the refreshed rate rather than the old in-memory copy.
+    assert RateSchedule("key", "abc123").rate["version"] == 2
+    assert requests_made == ["abc123", "abc123"]
@@ -0,0 +1,112 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from ubc.calculator import SingleSite, tou_key
+from ubc.rates.abstract import AbstractRate
+
+
+# One timestamp per cell of the (is_weekday, month, hour) grid, and then some.
+INDEX = pd.date_range("2019-01-01", "2019-12-31 23:00", freq="H", name="timestamp")
+
+
+def merge_lookup(schedule, column, index=INDEX):
+    """Look up `column` by joining the long-form schedule onto each timestamp."""
+    grain = pd.DataFrame(
+        {
+            "is_weekday": index.dayofweek < 5,
+            "month": index.month,
+            "hour": index.hour,
+        }
+    )
+    return grain.merge(
+        schedule, on=["is_weekday", "month", "hour"], how="left"
+    )[column].values
+
+
+@pytest.mark.parametrize(
+    "array, frame, column",
+    [
+        ("energy_array", "energy", "rate"),
+        ("demand_array", "demand", "rate"),
+        ("demand_schedule_array", "demand", "schedule_id"),
+    ],
+)
+def test_tou_arrays_match_schedule(schedule, array, frame, column):
+    grid = getattr(schedule, array)
+    assert grid.shape == (2, 12, 24)
+    np.testing.assert_array_equal(
+        np.take(grid, tou_key(INDEX)), merge_lookup(getattr(schedule, frame), column)
+    )
+
+
+class ScheduleRate(AbstractRate):
+    """Rate implementing only the abstract long-form schedules."""
+
+    def __init__(self, energy, demand, flatdemand):
+        self._schedules = energy, demand, flatdemand
+
+    @property
+    def energy(self):
+        return self._schedules[0]
+
+    @property
+    def demand(self):
+        return self._schedules[1]
+
+    @property
+    def flatdemand(self):
+        return self._schedules[2]
+
+
+def test_abstract_rate_defaults(schedule):
+    rate = ScheduleRate(schedule.energy, schedule.demand, schedule.flatdemand)
+    for array in ("energy_array", "demand_array", "demand_schedule_array"):
+        np.testing.assert_array_equal(getattr(rate, array), getattr(schedule, array))
+        assert getattr(rate, array) is getattr(rate, array)
+
+    load = pd.Series(np.arange(len(INDEX), dtype=float), index=INDEX, name="kWh")
+    energy = SingleSite(rate).calculate_energy_charges(load)
+    expected = load * merge_lookup(schedule.energy, "rate")
+    np.testing.assert_allclose(energy["cost"].values, expected.values, rtol=1e-6)
+
+
+def test_abstract_rate_without_demand(schedule):
+    demand = schedule.demand.iloc[:0]
+    rate = ScheduleRate(schedule.energy, demand, schedule.flatdemand)
+    assert np.isnan(rate.demand_array).all()
+    assert (rate.demand_schedule_array == 0).all()
+
+
+def test_season_array_matches_schedule(schedule):
+    energy = schedule.energy.assign(
+        season=schedule.energy["schedule_id"].map(schedule.seasons)
+    )
+    np.testing.assert_array_equal(
+        np.take(schedule.season_array, tou_key(INDEX)), merge_lookup(energy, "season")
+    )
+    assert set(schedule.season_array.ravel()) == {"Summer", "Winter"}
+
+
+def test_abstract_rate_default_seasons(schedule):
+    rate = ScheduleRate(schedule.energy, schedule.demand, schedule.flatdemand)
+    assert rate.seasons == {i: f"Season-{i}" for i in range(5)}
+
+    schedule_id = merge_lookup(schedule.energy, "schedule_id")
+    expected = [f"Season-{i}" for i in schedule_id]
+    np.testing.assert_array_equal(np.take(rate.season_array, tou_key(INDEX)), expected)
+
+
+def test_tou_schedules_are_not_shared(schedule):
+    other = type(schedule)("key", schedule.openei_schedule_id)
+    other.energy["rate"] = 0.0
+    assert (schedule.energy["rate"] > 0).all()
+
+
+def test_tou_schedule_cache_is_bounded(schedule, monkeypatch):
+    cls = type(schedule)
+    monkeypatch.setattr(cls, "_tou_schedules", type(cls._tou_schedules)())
+    monkeypatch.setattr(cls, "_tou_schedules_maxsize", 3)
+    for i in range(5):
+        cls("key", f"stub-{i}").energy
+    assert list(cls._tou_schedules) == [(f"stub-{i}", "Energy") for i in (2, 3, 4)]
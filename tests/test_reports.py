@@ -0,0 +1,44 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from ubc.calculator import SingleSite
+from ubc.reports import MonthlyBillReport, batch_monthly_reports
+
+
+def make_load(start, end, freq, seed):
+    index = pd.date_range(start, end, freq=freq)
+    rng = np.random.default_rng(seed)
+    return pd.Series(rng.random(len(index)) * 100, index=index)
+
+
+@pytest.fixture
+def sites(schedule):
+    calculator = SingleSite(schedule)
+    loads = {
+        "site-0": make_load("2019-01-01", "2019-12-31 23:45", "15 min", 0),
+        "site-1": make_load("2019-02-03 05:30", "2019-06-04 17:00", "30 min", 1),
+        "site-2": make_load("2019-03-01", "2019-05-10 13:55", "5 min", 2),
+        "site-3": make_load("2019-06-01", "2019-09-30 23:00", "H", 3),
+        "site-4": make_load("2019-11-01", "2020-01-31 23:45", "15 min", 4),
+    }
+    return loads, {name: calculator for name in loads}
+
+
+def test_batch_monthly_reports(sites):
+    loads, calculators = sites
+    result = batch_monthly_reports(loads, calculators, n_jobs=2, chunk_size=2)
+
+    assert list(result) == list(loads)
+    for name, load in loads.items():
+        expected = MonthlyBillReport(load, name, calculators[name]).monthly
+        pd.testing.assert_frame_equal(result[name], expected)
+
+
+def test_batch_monthly_reports_mismatched_sites(sites):
+    loads, calculators = sites
+    del loads["site-1"]
+    calculators["site-5"] = calculators["site-0"]
+
+    with pytest.raises(ValueError, match=r"\['site-1', 'site-5'\]"):
+        batch_monthly_reports(loads, calculators, n_jobs=2, chunk_size=2)
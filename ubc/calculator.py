@@ -1,16 +1,216 @@
+import numpy as np
+import pandas as pd
+
 from dataclasses import dataclass
-from pandas import Timedelta, NA
+from pandas import Timedelta
+from pandas.tseries.offsets import Tick
 
 from ubc.rates.abstract import AbstractRate
 
 
 DELTA_HOUR = Timedelta("1 hour")
+DELTA_15MIN = Timedelta("15 min")
 
 
 class UnknownRateStructure(Exception):
     pass
 
 
+def _named(load, name):
+    """View of `load` with default series and index names, sharing its data.
+
+    Args:
+        load (pd.Series):  Time indexed series of load data.
+        name (str):  Name to use if the series is unnamed, e.g. "kW".
+    """
+    index = load.index.rename(load.index.name or "timestamp")
+    return pd.Series(load.values, index=index, name=load.name or name)
+
+
+def _weekday_mask(index):
+    """Boolean array marking Monday through Friday timestamps.
+    """
+    return index.dayofweek.values < 5
+
+
+def tou_key(index):
+    """Flat position of each timestamp in a (2, 12, 24) TOU rate grid.
+
+    The grid is indexed by [is_weekday, month - 1, hour], so the key is
+    ``is_weekday * 288 + (month - 1) * 24 + hour`` and can be used with
+    ``np.take`` on any grid built by the rate schedule.
+
+    Args:
+        index (pd.DatetimeIndex): Timestamps to look up.
+    """
+    is_weekday = _weekday_mask(index).astype(np.intp)
+    return is_weekday * 288 + (index.month.values - 1) * 24 + index.hour.values
+
+
+def _month_bounds(index):
+    """Position of the first timestamp of each calendar month in a sorted index.
+
+    Args:
+        index (pd.DatetimeIndex): Sorted timestamps.
+
+    Returns:
+        Tuple of the positions and the month end labels used by ``resample("M")``.
+    """
+    first, last = index[0], index[-1]
+    n_months = (last.year - first.year) * 12 + last.month - first.month + 1
+    start = first.normalize().replace(day=1)
+    bounds = index.searchsorted(pd.date_range(start, periods=n_months, freq="MS"))
+    months = pd.date_range(start, periods=n_months, freq="M", name=index.name)
+    return bounds, months
+
+
+def _monthly_sum(index, values):
+    """Sum `values` by calendar month.
+
+    Same result as ``pd.Series(values, index).resample("M").sum()``, computed with
+    ``np.add.reduceat`` over the month boundaries when the index is sorted.
+
+    Args:
+        index (pd.DatetimeIndex): Timestamps of `values`.
+        values (np.ndarray): Values to aggregate, missing values count as 0.
+    """
+    if len(index) == 0 or not index.is_monotonic_increasing:
+        return pd.Series(values, index=index).resample("M").sum()
+
+    bounds, months = _month_bounds(index)
+    totals = np.add.reduceat(np.nan_to_num(values, nan=0.0), bounds)
+    # reduceat returns the value at the boundary for months without data.
+    totals[np.diff(bounds, append=len(index)) == 0] = 0.0
+    return pd.Series(totals, index=months)
+
+
+def _monthly_max(load):
+    """Maximum of `load` in each calendar month.
+
+    Same result as ``load.resample("M").max()``, computed with ``np.fmax.reduceat``
+    over the month boundaries when the index is sorted.
+
+    Args:
+        load (pd.Series):  Time indexed series of load data.
+    """
+    if load.empty or not load.index.is_monotonic_increasing:
+        return load.resample("M").max()
+
+    bounds, months = _month_bounds(load.index)
+    peak = np.fmax.reduceat(load.values.astype(np.float64), bounds)
+    # reduceat returns the value at the boundary for months without data.
+    peak[np.diff(bounds, append=len(load)) == 0] = np.nan
+    return pd.Series(peak, index=months, name=load.name)
+
+
+def _days_per_month(index):
+    """Number of days in each calendar month between the first and last timestamp.
+
+    Computed from month lengths: partial first and last months only count the days
+    covered.  Every covered day is counted, whether or not its load readings are
+    missing, since the meter is charged regardless of the reading.
+
+    Args:
+        index (pd.DatetimeIndex): Timestamps of the load data.
+    """
+    if len(index) == 0:
+        months = pd.DatetimeIndex([], tz=index.tz, name=index.name)
+        return pd.Series([], index=months, dtype=np.int64)
+
+    first, last = index.min().normalize(), index.max().normalize()
+    n_months = (last.year - first.year) * 12 + last.month - first.month + 1
+    months = pd.date_range(first, periods=n_months, freq="M", name=index.name)
+
+    days = months.days_in_month.values.copy()
+    days[0] -= first.day - 1
+    days[-1] -= months[-1].day - last.day
+    return pd.Series(days, index=months)
+
+
+def _floor(ts, freq):
+    """Floor `ts` to `freq`, keeping the DST side of `ts` for ambiguous wall times.
+    """
+    return ts.floor(freq, ambiguous=bool(ts.dst()))
+
+
+def _ffill(values):
+    """Forward fill NaNs in a 1-d array, leaving leading NaNs in place.
+    """
+    idx = np.where(np.isnan(values), 0, np.arange(len(values)))
+    np.maximum.accumulate(idx, out=idx)
+    return values[idx]
+
+
+def _demand_15min(load):
+    """15 min. average demand, forward filled over gaps.
+
+    Equivalent to ``load.resample("15 min").mean().ffill()``.  When the load is on
+    a regular interval that evenly divides (or is a multiple of) 15 minutes and
+    divides the hour, and is aligned to it, this is computed by reshaping the
+    underlying array instead of resampling.
+
+    Args:
+        load (pd.Series):  Time indexed series of load data in kW.
+    """
+    freq = load.index.freq
+    step = Timedelta(freq) if isinstance(freq, Tick) else None
+    regular = (
+        step is not None
+        and step > Timedelta(0)
+        and len(load) > 0
+        and not DELTA_HOUR % step
+        and not (DELTA_15MIN % step if step < DELTA_15MIN else step % DELTA_15MIN)
+    )
+    if regular:
+        start = _floor(load.index[0], "15 min")
+        offset, misaligned = divmod(load.index[0] - start, step)
+    if not regular or misaligned:
+        return load.resample("15 min").mean().ffill()
+
+    values = load.values.astype(np.float64)
+    if step < DELTA_15MIN:
+        # Pad out to whole 15 min. intervals and average each, skipping missing samples.
+        per_interval = DELTA_15MIN // step
+        n_intervals = -(-(offset + len(load)) // per_interval)
+        padded = np.full(n_intervals * per_interval, np.nan)
+        padded[offset : offset + len(load)] = values
+        padded = padded.reshape(n_intervals, per_interval)
+        count = (~np.isnan(padded)).sum(axis=1)
+        with np.errstate(invalid="ignore"):
+            values = np.nansum(padded, axis=1) / count
+    values = _ffill(values)
+    if step > DELTA_15MIN:
+        # Each sample covers several 15 min. intervals, up until the last sample.
+        repeats = step // DELTA_15MIN
+        values = np.repeat(values, repeats)[: (len(load) - 1) * repeats + 1]
+
+    index = pd.date_range(
+        start, periods=len(values), freq="15 min", name=load.index.name
+    )
+    return pd.Series(values, index=index, name=load.name)
+
+
+def _hourly_peak_demand(load):
+    """Hourly maximum of 15 min. average demand.
+
+    Args:
+        load (pd.Series):  15 min. demand data in kW, as returned by `_demand_15min`.
+    """
+    if load.empty:
+        return load.resample("H").max()
+
+    # Pad out to whole hours so the intervals can be viewed as (n_hours, 4)
+    start = _floor(load.index[0], "H")
+    offset = (load.index[0] - start) // DELTA_15MIN
+    n_hours = -(-(offset + len(load)) // 4)
+    values = np.full(n_hours * 4, np.nan)
+    values[offset : offset + len(load)] = load.values
+
+    peak = np.fmax.reduce(values.reshape(n_hours, 4), axis=1)
+    index = pd.date_range(start, periods=n_hours, freq="H", name=load.index.name)
+    return pd.Series(peak, index=index, name=load.name)
+
+
 @dataclass
 class SingleSite:
     """Single-Site Bill Calculator
@@ -23,91 +223,103 @@ class SingleSite:
         Args:
             load (pd.Series):  Time indexed series of load data in kWh.
         """
-        load = load.copy()
-        load.rename(load.name or "kWh", inplace=True)
-        load.rename_axis(load.index.name or "timestamp", inplace=True)
-
-        load_grain = [
-            ~load.index.dayofweek.isin([5, 6]),
-            load.index.month,
-            load.index.hour,
-        ]
-        schedule_grain = ["is_weekday", "month", "hour"]
+        load = _named(load, "kWh")
+        # Charges are returned in time order.
+        if not load.index.is_monotonic_increasing:
+            load = load.sort_index()
 
         # Assign rates to the provided load data.
-        rates = self.schedule.energy.merge(
-            load.reset_index(), right_on=load_grain, left_on=schedule_grain, how="right"
-        )[[load.index.name, load.name, "rate"]]
+        rate = self._energy_rate(load.index)
 
-        rates["cost"] = rates[load.name] * rates["rate"]
-        rates.rename(columns={"rate": f"{load.name}_rate"}, inplace=True)
-        return rates.set_index(load.index.name).sort_index()
+        return pd.DataFrame(
+            {
+                load.name: load.values,
+                f"{load.name}_rate": rate,
+                "cost": load.values * rate,
+            },
+            index=load.index,
+        )
+
+    def _energy_rate(self, index):
+        """Look up the $/kWh rate of each timestamp in the dense energy rate grid.
+        """
+        return np.take(self.schedule.energy_array, tou_key(index))
 
     def calculate_demand_charges(self, load):
         """
         Args:
             load (pd.Series):  Time indexed series of load data in kW.
         """
-        load = load.copy()
-        load.rename(load.name or "kW", inplace=True)
-        load.rename_axis(load.index.name or "timestamp", inplace=True)
-
-        # Resample to 15min intervals and then upsample to month level taking maximum demand
-        load = load.resample("15 min").mean().fillna(method="pad").resample("H").max()
+        load = _named(load, "kW")
 
-        load_grain = [
-            ~load.index.dayofweek.isin([5, 6]),
-            load.index.month,
-            load.index.hour,
-        ]
-        schedule_grain = ["is_weekday", "month", "hour"]
+        return self._demand_charges(_demand_15min(load))
 
-        # Assign rates to the provided load data.
-        demand_rates = self.schedule.demand
-
-        rates = demand_rates.merge(
-            load.reset_index(), right_on=load_grain, left_on=schedule_grain, how="right"
-        )[[load.index.name, load.name, "rate", "schedule_id"]]
-        # Calculate max demand over 15 min. period for each month
+    def _demand_charges(self, load):
+        """
+        Args:
+            load (pd.Series):  15 min. demand data in kW from `_demand_15min`.
+        """
+        # Take the maximum 15 min. demand in each hour
+        load = _hourly_peak_demand(load)
 
-        if demand_rates.empty:
-            rates["schedule_id"] = rates["schedule_id"].fillna(int(0))
-            rates["rate"] = NA
+        # Assign rates and schedule ids to the provided load data.
+        key = tou_key(load.index)
+        rate = np.take(self.schedule.demand_array, key)
+        schedule_id = np.take(self.schedule.demand_schedule_array, key)
 
-        rates[f"cost"] = rates[load.name] * rates["rate"]
-        rates = rates.set_index(load.index.name).sort_index()
-        rates.rename(columns={"rate": f"{load.name}_rate"}, inplace=True)
+        rates = pd.DataFrame(
+            {
+                "schedule_id": schedule_id,
+                load.name: load.values,
+                f"{load.name}_rate": rate,
+                "cost": load.values * rate,
+            },
+            index=load.index,
+        )
         # Finally, only take the maximum demand charge in each billing period for each schedule ID
         # Each schedule ID represents a different demand charge type (part peak, full peak)
-        rates = rates.pivot(
-            columns="schedule_id", values=[load.name, f"{load.name}_rate", f"cost"]
+        # Reduce to one row per (billing period, schedule ID) before reshaping.
+        return (
+            rates.groupby([pd.Grouper(freq="M"), "schedule_id"])
+            .max()
+            .unstack("schedule_id")
         )
-        return rates.resample("M").max()
 
     def calculate_flatdemand_charges(self, load):
         """
         Args:
             load (pd.Series):  Time indexed series of load data in kW.
         """
-        load = load.copy()
-        load.rename(load.name or "kW", inplace=True)
-        load.rename_axis(load.index.name or "timestamp", inplace=True)
+        load = _named(load, "kW")
+
+        return self._flatdemand_charges(_demand_15min(load))
 
-        # Resample to 15min intervals and then upsample to month level taking maximum demand
-        load = load.resample("15 min").mean().fillna(method="pad").resample("M").max()
+    def _flatdemand_charges(self, load):
+        """
+        Args:
+            load (pd.Series):  15 min. demand data in kW from `_demand_15min`.
+        """
+        # Upsample to month level taking maximum demand
+        load = _monthly_max(load)
 
-        load_grain = [load.index.month]
-        schedule_grain = ["month"]
+        load_grain = pd.DataFrame(
+            {
+                load.index.name: load.index,
+                load.name: load.values,
+                "month": load.index.month,
+            }
+        )
 
         # Assign rates to the provided load data.
+        # A right merge keeps the (already sorted) order of the load.
         rates = self.schedule.flatdemand.merge(
-            load.reset_index(), right_on=load_grain, left_on=schedule_grain, how="right"
+            load_grain, on="month", how="right", sort=False, copy=False
         )[[load.index.name, load.name, "rate"]]
 
         # Calculate max demand over 15 min. period for each month
         rates["cost"] = rates[load.name] * rates["rate"]
         rates.rename(columns={"rate": f"{load.name}_rate"}, inplace=True)
-        return rates.set_index(load.index.name).sort_index()
+        return rates.set_index(load.index.name)
 
     def calculate_meter_charges(self, load, charge_type=None):
         """
@@ -118,15 +330,17 @@ class SingleSite:
         charge_unit = self.schedule.meter_charge_unit
         if charge_unit == "$/day":
             # Meter charges exist per-diem, the actual aggregate load value doesn't matter.
-            # Aggregate to dailies, then count up the months.
-            N = load.resample("D").nearest().resample("M").count()
+            # Count up the days covered by the load in each month.
+            N = _days_per_month(load.index)
         elif charge_unit == "$/month":
             # if meter charges exist per-month, we simply have one charge per month in our index
             # So normalize to 1!
-            N = load.resample("D").nearest().resample("M").count()
+            N = _days_per_month(load.index)
             N = N / N
         else:
-            raise UnknownRateStructure("Unknown meter charge unit: {}".format())
+            raise UnknownRateStructure(
+                "Unknown meter charge unit: {}".format(charge_unit)
+            )
         cost = N * self.schedule.meter
         return cost.rename("cost")
 
@@ -137,14 +351,21 @@ class SingleSite:
         """
 
         interval = load_kw.index.freq.delta / DELTA_HOUR
-        energy_charges = (
-            self.calculate_energy_charges(load_kw * interval)["cost"]
-            .resample("M")
-            .sum()
-        )
-        demand_charges = self.calculate_demand_charges(load_kw)["cost"].sum(axis=1)
-        flatdemand_charges = self.calculate_flatdemand_charges(load_kw)["cost"]
+        # Only the monthly energy cost is needed here, so skip building the
+        # per-interval charges frame and reduce the costs straight into months.
+        energy_cost = load_kw.values * interval * self._energy_rate(load_kw.index)
+        energy_charges = _monthly_sum(load_kw.index, energy_cost)
+        # Demand and flat demand charges share the same 15 min. resampled load.
+        load_15min = _demand_15min(_named(load_kw, "kW"))
+        demand_charges = self._demand_charges(load_15min)["cost"].sum(axis=1)
+        flatdemand_charges = self._flatdemand_charges(load_15min)["cost"]
         meter_charges = self.calculate_meter_charges(load_kw)
-        return (
-            meter_charges + energy_charges + demand_charges + flatdemand_charges
-        ).rename("total_cost")
+
+        # Align all charge components in one pass; a month missing any component
+        # has no total.
+        charges = pd.concat(
+            [meter_charges, energy_charges, demand_charges, flatdemand_charges],
+            axis=1,
+            copy=False,
+        )
+        return charges.sum(axis=1, min_count=charges.shape[1]).rename("total_cost")
@@ -1,5 +1,7 @@
 from abc import ABC, abstractmethod
 
+import numpy as np
+
 
 class AbstractRate(ABC):
 
@@ -17,3 +19,74 @@ class AbstractRate(ABC):
     @abstractmethod
     def flatdemand(self):
         pass
+
+    @property
+    def energy_array(self):
+        """Dense lookup of $/kWh rates, built from `energy`.
+
+        Returns:
+            Array of shape (2, 12, 24) indexed by [is_weekday, month - 1, hour].
+        """
+        if getattr(self, "_energy_array", None) is None:
+            self._energy_array = self._tou_array(self.energy, "rate")
+        return self._energy_array
+
+    @property
+    def demand_array(self):
+        """Dense lookup of $/kW TOU demand rates, built from `demand`.
+
+        Returns:
+            Array of shape (2, 12, 24) indexed by [is_weekday, month - 1, hour].
+        """
+        if getattr(self, "_demand_array", None) is None:
+            self._demand_array = self._tou_array(self.demand, "rate")
+        return self._demand_array
+
+    @property
+    def demand_schedule_array(self):
+        """Dense lookup of TOU demand schedule ids, built from `demand`.
+
+        Returns:
+            Array of shape (2, 12, 24) indexed by [is_weekday, month - 1, hour].
+            Cells without a demand schedule are assigned to schedule 0.
+        """
+        if getattr(self, "_demand_schedule_array", None) is None:
+            self._demand_schedule_array = self._tou_array(
+                self.demand, "schedule_id", fill_value=0, dtype=np.int8
+            )
+        return self._demand_schedule_array
+
+    @property
+    def seasons(self):
+        """Mapping between energy schedule ids and season names.
+        """
+        return {i: f"Season-{i}" for i in sorted(self.energy["schedule_id"].unique())}
+
+    @property
+    def season_array(self):
+        """Dense lookup of energy season names, built from `energy` and `seasons`.
+
+        Returns:
+            Object array of shape (2, 12, 24) indexed by [is_weekday, month - 1, hour].
+        """
+        if getattr(self, "_season_array", None) is None:
+            energy = self.energy.assign(
+                season=self.energy["schedule_id"].map(self.seasons)
+            )
+            self._season_array = self._tou_array(energy, "season", dtype=object)
+        return self._season_array
+
+    @staticmethod
+    def _tou_array(schedule, column, fill_value=np.nan, dtype=np.float32):
+        """Pivot a melted TOU schedule into a dense (is_weekday, month, hour) grid.
+
+        Cells without a schedule entry are left as `fill_value`.
+        """
+        grid = np.full((2, 12, 24), fill_value, dtype=dtype)
+        if not schedule.empty:
+            grid[
+                schedule["is_weekday"].values.astype(np.intp),
+                schedule["month"].values.astype(np.intp) - 1,
+                schedule["hour"].values.astype(np.intp),
+            ] = schedule[column].values
+        return grid
@@ -1,7 +1,11 @@
+import functools
+import json
+import os
 import requests
 import pandas as pd
 
-from dataclasses import dataclass, field
+from collections import OrderedDict
+from dataclasses import dataclass, field, fields
 from urllib.parse import urljoin
 
 from ..abstract import AbstractRate
@@ -10,6 +14,9 @@ from .schemas import URDBMeta, Energy, Demand, FlatDemand, Meter
 
 root = "https://api.openei.org"
 
+# Reuse connections across requests.
+session = requests.Session()
+
 
 class UnknownRateStructure(Exception):
     pass
@@ -26,9 +33,18 @@ class RateSchedule(AbstractRate):
     _demand: "typing.Any" = field(init=False, repr=False, default=None)
     _flatdemand: "typing.Any" = field(init=False, repr=False, default=None)
     _meter: "typing.Any" = field(init=False, repr=False, default=None)
+    _meter_charge_unit: "typing.Any" = field(init=False, repr=False, default=None)
+    _energy_array: "typing.Any" = field(init=False, repr=False, default=None)
+    _demand_array: "typing.Any" = field(init=False, repr=False, default=None)
+    _demand_schedule_array: "typing.Any" = field(init=False, repr=False, default=None)
+    _season_array: "typing.Any" = field(init=False, repr=False, default=None)
 
     url = urljoin(root, "utility_rates")
 
+    # Most recently parsed TOU schedules keyed on (openei_schedule_id, schema name).
+    _tou_schedules = OrderedDict()
+    _tou_schedules_maxsize = 128
+
     def __post_init__(self):
         self.name = URDBMeta.name.search(self.rate)
         self.description = URDBMeta.description.search(self.rate)
@@ -41,22 +57,28 @@ class RateSchedule(AbstractRate):
             self._rate = self.load_rate()
         return self._rate
 
-    def load_rate(self):
-        params = {
-            "api_key": self.apikey,
-            "getpage": self.openei_schedule_id,
-            "format": "json",
-            # Unclear whether 'version' changes response schema.  7 at time of development.
-            "version": "latest",
-            "detail": "full",
-        }
-        rate = requests.get(self.url, params=params).json()
+    def load_rate(self, refresh=False):
+        """Get the OpenEI rate, from the cache unless `refresh` is set.
 
-        # Python 3.8
-        # assert (n := len(rate["items"])) == 1, f"Expected 1 rate, found {n}"
-        n = len(rate["items"])
-        assert n == 1, f"Expected 1 rate, found {n}"
-        return rate["items"][0]
+        Args:
+            refresh (bool): Download the rate again and overwrite the cached copy.
+        """
+        if refresh:
+            rate = _download_rate(self.url, self.apikey, self.openei_schedule_id)
+            _fetch_rate.cache_clear()
+            return rate
+        return _fetch_rate(self.url, self.apikey, self.openei_schedule_id)
+
+    def refresh(self):
+        """Re-download the rate and drop everything parsed from the cached copy.
+        """
+        for f in fields(self):
+            if not f.init:
+                setattr(self, f.name, None)
+        for schema in (Energy, Demand):
+            self._tou_schedules.pop((self.openei_schedule_id, schema.__name__), None)
+        self._rate = self.load_rate(refresh=True)
+        self.__post_init__()
 
     @property
     def energy(self):
@@ -70,8 +92,8 @@ class RateSchedule(AbstractRate):
 
             month            int64
             hour            object
-            schedule_id      int64
-            rate           float64
+            schedule_id       int8
+            rate           float32
             is_weekday        bool
         """
         if self._energy is None:
@@ -85,11 +107,27 @@ class RateSchedule(AbstractRate):
         return self._demand
 
     def _parse_tou_schedule(self, schema):
+        """Parse a weekday/weekend month-hour schedule into a long-form frame.
+
+        Parsing is shared between instances of the same OpenEI schedule, for up to
+        `_tou_schedules_maxsize` schedules.
+        """
+        key = (self.openei_schedule_id, schema.__name__)
+        if key in self._tou_schedules:
+            self._tou_schedules.move_to_end(key)
+        else:
+            self._tou_schedules[key] = self._melt_tou_schedule(schema)
+            if len(self._tou_schedules) > self._tou_schedules_maxsize:
+                self._tou_schedules.popitem(last=False)
+        # Each instance gets its own copy, so edits do not leak between instances.
+        return self._tou_schedules[key].copy()
+
+    def _melt_tou_schedule(self, schema):
         """
         """
         rate = pd.Series(schema.path.search(self.rate))
-        # Create empty dataframe to hold rate schedules.
-        rate_schedule = pd.DataFrame()
+        # Collect weekend and weekday schedules, then concatenate once.
+        frames = []
         for _s in (schema.weekend_schedule, schema.weekday_schedule,):
 
             # Each row represents 1 month
@@ -104,11 +142,11 @@ class RateSchedule(AbstractRate):
             # Map Rates
             schedule["rate"] = schedule["schedule_id"].map(rate)
 
-            # Add to master rate schedule
-            rate_schedule = rate_schedule.append(
-                schedule.assign(**_s.metadata), ignore_index=True)
+            frames.append(schedule.assign(**_s.metadata))
 
-        return rate_schedule
+        rate_schedule = pd.concat(frames, ignore_index=True, copy=False)
+        # Schedule ids are small and rates are only quoted to a few decimals.
+        return rate_schedule.astype({"schedule_id": "int8", "rate": "float32"})
 
     @property
     def flatdemand(self):
@@ -119,8 +157,8 @@ class RateSchedule(AbstractRate):
         Schema:
 
             month            int64
-            schedule_id      int64
-            rate           float64
+            schedule_id       int8
+            rate           float32
         """
         if self._flatdemand is None:
             self._flatdemand = self._parse_flatdemand_rates()
@@ -139,7 +177,7 @@ class RateSchedule(AbstractRate):
         ).rename_axis("month").rename("schedule_id").reset_index()
         schedule["month"] += 1
         schedule["rate"] = schedule["schedule_id"].map(rate)
-        return schedule
+        return schedule.astype({"schedule_id": "int8", "rate": "float32"})
 
     def _parse_charge_period(self, attrs, period_attr):
         """
@@ -203,10 +241,68 @@ class RateSchedule(AbstractRate):
 
     @property
     def meter_charge_unit(self):
-        rate = self.rate
-        return Meter.charge_unit.search(rate)
+        if self._meter_charge_unit is None:
+            self._meter_charge_unit = Meter.charge_unit.search(self.rate)
+        return self._meter_charge_unit
 
     @property
     def meter(self):
-        rate = self.rate
-        return Meter.path.search(rate)
\ No newline at end of file
+        if self._meter is None:
+            self._meter = Meter.path.search(self.rate)
+        return self._meter
+
+
+def cache_dir():
+    """Directory of cached OpenEI responses.
+
+    Rates are immutable for a given schedule id, so responses are kept on disk under
+    `$XDG_CACHE_HOME/ubc/openei`, resolved on every call.
+    """
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache")
+    return os.path.join(base, "ubc", "openei")
+
+
+@functools.lru_cache(maxsize=128)
+def _fetch_rate(url, apikey, openei_schedule_id):
+    """Get a single rate, from the on-disk cache if possible.
+    """
+    path = os.path.join(cache_dir(), f"{openei_schedule_id}.json")
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        pass
+    return _download_rate(url, apikey, openei_schedule_id)
+
+
+def _download_rate(url, apikey, openei_schedule_id):
+    """Get a single rate from OpenEI and write it to the on-disk cache.
+    """
+    params = {
+        "api_key": apikey,
+        "getpage": openei_schedule_id,
+        "format": "json",
+        # Unclear whether 'version' changes response schema.  7 at time of development.
+        "version": "latest",
+        "detail": "full",
+    }
+    rate = session.get(url, params=params).json()
+
+    # Python 3.8
+    # assert (n := len(rate["items"])) == 1, f"Expected 1 rate, found {n}"
+    n = len(rate["items"])
+    assert n == 1, f"Expected 1 rate, found {n}"
+    rate = rate["items"][0]
+
+    # Caching is best-effort; write to a temporary file so readers never see a
+    # partial response.
+    path = os.path.join(cache_dir(), f"{openei_schedule_id}.json")
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, "w") as f:
+            json.dump(rate, f)
+        os.replace(tmp, path)
+    except OSError:
+        pass
+    return rate
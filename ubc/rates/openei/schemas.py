@@ -1,6 +1,11 @@
+import re
+
 import jmespath
 
 
+IDENTIFIER = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
+
+
 class URDBPath:
 
     def __init__(self, expression, **meta):
@@ -12,10 +17,14 @@ class URDBPath:
         """
         self.expression = jmespath.compile(expression)
         self.metadata = meta
+        # Top-level keys can be looked up directly, without walking the parse tree.
+        self._simple_key = expression if IDENTIFIER.match(expression) else None
 
     def search(self, data):
         """Proxy method for compiled jmespath search.
         """
+        if self._simple_key is not None and isinstance(data, dict):
+            return data.get(self._simple_key)
         return self.expression.search(data)
 
 
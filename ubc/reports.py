@@ -1,7 +1,9 @@
+import numpy as np
 import pandas as pd
-from dataclasses import dataclass
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
 
-from .calculator import SingleSite
+from .calculator import SingleSite, tou_key
 
 
 @dataclass
@@ -13,6 +15,13 @@ class MonthlyBillReport:
     name: str
     calculator: SingleSite
 
+    _seasonal_load: "typing.Any" = field(init=False, repr=False, default=None)
+    _demand: "typing.Any" = field(init=False, repr=False, default=None)
+    _energy: "typing.Any" = field(init=False, repr=False, default=None)
+    _meter: "typing.Any" = field(init=False, repr=False, default=None)
+    _monthly: "typing.Any" = field(init=False, repr=False, default=None)
+    _annual: "typing.Any" = field(init=False, repr=False, default=None)
+
     def __post_init__(self):
         self.load = self.load.copy()
         self.load.name = self.load.name or "kW"
@@ -20,81 +29,124 @@ class MonthlyBillReport:
 
     @property
     def seasonal_load(self):
-        rate_grain = [
-            "is_weekday",
-            "month",
-            "hour",
-        ]
-        load = self.load.reset_index()
-
-        # Load is a function of month, hour, is_weekday
-        load_grain = [
-            ~load[self.load.index.name].dt.dayofweek.isin([5, 6]),
-            load[self.load.index.name].dt.month,
-            load[self.load.index.name].dt.hour,
-        ]
-
-        load = load.merge(
-            self.calculator.schedule.energy,
-            right_on=rate_grain,
-            left_on=load_grain,
-            how="left",
-        )
-        load["season"] = load["schedule_id"].map(self.calculator.schedule.seasons)
-
-        return load[[self.load.name, self.load.index.name, "season"]].set_index(
-            self.load.index.name
-        )
+        if self._seasonal_load is None:
+            # Load is a function of month, hour, is_weekday
+            season = np.take(
+                self.calculator.schedule.season_array, tou_key(self.load.index)
+            )
+            self._seasonal_load = pd.DataFrame(
+                {self.load.name: self.load.values, "season": season},
+                index=self.load.index,
+            )
+        return self._seasonal_load
 
     @property
     def demand(self):
         """
         Aggregates all demand charges and values to a single value.
         """
-        cols = {"cost": "Demand ($)", self.load.name: "Demand (kW)"}
-        flatdemand_charges = self.calculator.calculate_flatdemand_charges(
-            self.load
-        ).rename(columns=cols)
-        flat_charges = flatdemand_charges[list(cols.values())]
-
-        cols = {"cost": "Demand ($)", self.load.name: "Demand (kW)"}
-        peak_charges = (
-            self.calculator.calculate_demand_charges(self.load)
-            .rename(columns=cols)
-            .rename(columns=self.calculator.schedule.demand_periods, level=1)
-        )
-
-        for dup_col in peak_charges.columns[peak_charges.columns.duplicated()]:
-            S = peak_charges[dup_col].sum(axis=1)
-            peak_charges.drop(columns=dup_col, inplace=True)
-            peak_charges[dup_col] = S
-
-        peak_charges = peak_charges[list(cols.values())]
-        peak_charges.columns = peak_charges.columns.map(" - ".join)
-        return peak_charges.join(flat_charges)
+        if self._demand is None:
+            cols = {"cost": "Demand ($)", self.load.name: "Demand (kW)"}
+            flatdemand_charges = self.calculator.calculate_flatdemand_charges(
+                self.load
+            ).rename(columns=cols)
+            flat_charges = flatdemand_charges[list(cols.values())]
+
+            cols = {"cost": "Demand ($)", self.load.name: "Demand (kW)"}
+            peak_charges = (
+                self.calculator.calculate_demand_charges(self.load)
+                .rename(columns=cols)
+                .rename(columns=self.calculator.schedule.demand_periods, level=1)
+            )
+
+            # Schedules sharing a period name are combined into a single column.
+            # Combined periods are 0 in months none of their schedules apply.
+            merged = peak_charges.columns[peak_charges.columns.duplicated()].unique()
+            peak_charges = peak_charges.groupby(
+                level=[0, 1], axis=1, sort=False
+            ).sum(min_count=1)
+            peak_charges.loc[:, merged] = peak_charges.loc[:, merged].fillna(0)
+
+            peak_charges = peak_charges[list(cols.values())]
+            peak_charges.columns = peak_charges.columns.map(" - ".join)
+            self._demand = peak_charges.join(flat_charges)
+        return self._demand
 
     @property
     def energy(self):
-        energy_cols = {"cost": "Energy ($)", "kWh": "Energy (kWh)"}
-        energy_charges = self.calculator.calculate_energy_charges(
-            self.load.rename("kWh")
-        ).rename(columns=energy_cols)
-        return energy_charges[list(energy_cols.values())].resample("M").sum()
+        if self._energy is None:
+            energy_cols = {"cost": "Energy ($)", "kWh": "Energy (kWh)"}
+            energy_charges = self.calculator.calculate_energy_charges(
+                self.load.rename("kWh")
+            ).rename(columns=energy_cols)
+            energy_charges = energy_charges[list(energy_cols.values())]
+            self._energy = energy_charges.resample("M").sum()
+        return self._energy
 
     @property
     def meter(self):
-        meter_charges = self.calculator.calculate_meter_charges(self.load).rename(
-            "Meter ($)"
-        )
-        return meter_charges
+        if self._meter is None:
+            meter_charges = self.calculator.calculate_meter_charges(self.load)
+            self._meter = meter_charges.rename("Meter ($)")
+        return self._meter
 
     @property
     def monthly(self):
-        monthly = self.energy.join(self.demand).join(self.meter)
-        billing_cols = monthly.columns[monthly.columns.str.contains(r"\(\$\)")]
-        monthly["Total ($)"] = monthly[billing_cols].sum(axis=1).rename("Total ($)")
-        return monthly.rename_axis("Month")
+        if self._monthly is None:
+            monthly = pd.concat(
+                [self.energy, self.demand, self.meter], axis=1, copy=False
+            )
+            billing_cols = monthly.columns[monthly.columns.str.contains(r"\(\$\)")]
+            monthly["Total ($)"] = (
+                monthly[billing_cols].sum(axis=1).rename("Total ($)")
+            )
+            self._monthly = monthly.rename_axis("Month")
+        return self._monthly
 
     @property
     def annual(self):
-        return self.monthly.sum(axis=0).rename(self.name)
+        if self._annual is None:
+            self._annual = self.monthly.sum(axis=0).rename(self.name)
+        return self._annual
+
+
+def batch_monthly_reports(loads, calculators, n_jobs=None, chunk_size=16):
+    """Create monthly bill reports for many sites in parallel.
+
+    Sites are sent to worker processes in chunks, so the per-task overhead is paid
+    once per chunk rather than once per site.
+
+    Args:
+        loads (dict[str, pd.Series]): Load data in kW keyed on site name.
+        calculators (dict[str, SingleSite]): Calculator keyed on site name.
+        n_jobs (int): Number of worker processes.  None or -1 uses every CPU,
+            otherwise it must be positive.
+        chunk_size (int): Number of sites sent to a worker at a time.
+
+    Returns:
+        dict[str, pd.DataFrame]: Monthly bill report of each site.
+
+    Raises:
+        ValueError: If `loads` and `calculators` do not cover the same sites.
+    """
+    if loads.keys() != calculators.keys():
+        missing = sorted(set(loads) ^ set(calculators), key=str)
+        raise ValueError(f"Sites without both a load and a calculator: {missing}")
+
+    if n_jobs == -1:
+        n_jobs = None
+
+    names = list(loads)
+    with ProcessPoolExecutor(max_workers=n_jobs) as executor:
+        reports = executor.map(
+            _monthly_report,
+            names,
+            [loads[name] for name in names],
+            [calculators[name] for name in names],
+            chunksize=chunk_size,
+        )
+        return dict(zip(names, reports))
+
+
+def _monthly_report(name, load, calculator):
+    return MonthlyBillReport(load, name, calculator).monthly